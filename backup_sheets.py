@@ -3,30 +3,126 @@
 import os
 import json
 import base64
+import itertools
 import time
 import random
 import logging
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Sequence, Tuple
 import pytz
-import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config as BotoConfig
 from googleapiclient.discovery import build
 from google.oauth2 import service_account
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from functools import wraps
-from config import SHEETS_CONFIG, MAX_RETRIES
+from urllib.parse import quote
+try:
+    import orjson
+except ImportError:
+    orjson = None
+from config import (
+    SHEETS_CONFIG, MAX_RETRIES, MAX_WORKERS, BATCH_DELAY, SHEETS_REQUESTS_PER_MINUTE,
+    S3_PREFIX, S3_MULTIPART_CHUNKSIZE, S3_MAX_CONCURRENCY, PARQUET_ROW_GROUP_SIZE, TEXT_COLUMNS
+)
+
+# Patterns for sensitive information in error messages
+_SHEET_ID_RE = re.compile(r'[a-zA-Z0-9_-]{44}')
+_SHEETS_URL_RE = re.compile(r'https://sheets\.googleapis\.com/\S*')
+_GOOG_URL_RE = re.compile(r'https://\S*googleapis\.com\S*')
 
 def sanitize_error_message(error_msg: str) -> str:
     """Remove sensitive information from error messages"""
     # Remove sheet IDs (44-character alphanumeric strings)
-    error_msg = re.sub(r'[a-zA-Z0-9_-]{44}', '[SHEET_ID]', error_msg)
+    error_msg = _SHEET_ID_RE.sub('[SHEET_ID]', error_msg)
     # Remove API URLs
-    error_msg = re.sub(r'https://sheets\.googleapis\.com/[^\s]*', '[SHEETS_API_URL]', error_msg)
-    error_msg = re.sub(r'https://[^\s]*googleapis\.com[^\s]*', '[GOOGLE_API_URL]', error_msg)
+    error_msg = _SHEETS_URL_RE.sub('[SHEETS_API_URL]', error_msg)
+    error_msg = _GOOG_URL_RE.sub('[GOOGLE_API_URL]', error_msg)
     return error_msg
 
+def column_to_text(column: Sequence[Any]) -> pa.Array:
+    """Convert cell values to a text column, formatting non-text cells the way Arrow casts them"""
+    text = ['' if value is None else value for value in column]
+    
+    # Cast each non-text value type as a batch so 1.0 -> '1' and True -> 'true' in every code path
+    positions_by_type = {}
+    for i, value in enumerate(column):
+        if value is not None and not isinstance(value, str):
+            positions_by_type.setdefault(type(value), []).append(i)
+    for positions in positions_by_type.values():
+        values = [column[i] for i in positions]
+        try:
+            cast_values = pa.array(values).cast(pa.string()).to_pylist()
+        except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+            # e.g. integers beyond int64 such as long numeric IDs
+            cast_values = [str(value) for value in values]
+        for i, value in zip(positions, cast_values):
+            text[i] = value
+    
+    return pa.array(text, type=pa.string())
+
+def column_to_array(column: Sequence[Any], is_text: bool = False) -> pa.Array:
+    """Convert a column of cell values to Arrow, keeping numeric and boolean types where possible"""
+    if not is_text:
+        try:
+            # Blank cells become nulls so they don't force the column to text
+            # An all-blank column stays null-typed so it can merge with typed columns from other tabs
+            array = pa.array([None if value == '' else value for value in column])
+            if not pa.types.is_string(array.type):
+                return array
+        except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+            pass
+    return column_to_text(column)
+
+def rows_to_table(header: List[Any], data_rows: List[List[Any]], sheet_title: str) -> pa.Table:
+    """Build an Arrow table from ragged rows, tagged with the source tab name"""
+    names = [str(name) for name in header]
+    
+    if all(len(row) == len(names) for row in data_rows):
+        # Fast path: rows already match the header
+        columns = list(zip(*data_rows))
+    else:
+        # Transpose to columns, padding short rows and dropping cells beyond the header
+        columns = list(itertools.zip_longest(*data_rows, fillvalue=None))[:len(names)]
+        columns.extend([(None,) * len(data_rows)] * (len(names) - len(columns)))
+    
+    # A sheet_name column from the tab itself is replaced by the tab title
+    kept = [(name, column) for name, column in zip(names, columns) if name != 'sheet_name']
+    arrays = [column_to_array(column, name in TEXT_COLUMNS) for name, column in kept]
+    arrays.append(pa.array([sheet_title] * len(data_rows), type=pa.string()))
+    return pa.Table.from_arrays(arrays, names=[name for name, _ in kept] + ['sheet_name'])
+
+def combine_tables(tables: List[pa.Table]) -> pa.Table:
+    """Concatenate per-tab tables, storing a column as text if tabs disagree on its type"""
+    try:
+        # Tabs may have different columns; missing ones are filled with nulls
+        return pa.concat_tables(tables, promote_options='permissive')
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        pass
+    
+    column_types = {}
+    for table in tables:
+        for field in table.schema:
+            if not pa.types.is_null(field.type):
+                column_types.setdefault(field.name, set()).add(field.type)
+    conflicting = {name for name, types in column_types.items() if len(types) > 1}
+    
+    text_tables = []
+    for table in tables:
+        for i, field in enumerate(table.schema):
+            if field.name in conflicting and not pa.types.is_string(field.type):
+                table = table.set_column(i, field.name, column_to_text(table.column(i).to_pylist()))
+        text_tables.append(table)
+    return pa.concat_tables(text_tables, promote_options='permissive')
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -34,26 +130,115 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Pooled HTTP session for webhooks; urllib3 retries transient failures and honours Retry-After.
+# Read errors are not retried: the message may already have been posted.
+_http = requests.Session()
+_http.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(
+        total=3,
+        read=0,
+        backoff_factor=1,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset(['POST']),
+        respect_retry_after_header=True
+    )
+))
+
 class RateLimiter:
-    """Robust rate limiter with exponential backoff and jitter"""
+    """Robust rate limiter with a client-side token bucket, exponential backoff and jitter"""
     
     def __init__(self, max_retries: int = MAX_RETRIES):
         self.max_retries = max_retries
         self.base_delay = 1.0
         self.max_delay = 60.0
+        self.last_429_time = 0.0
+        
+        # Token bucket pacing requests below the Sheets per-minute quota
+        self.bucket_capacity = SHEETS_REQUESTS_PER_MINUTE
+        self.bucket_tokens = float(self.bucket_capacity)
+        self.bucket_refill_rate = self.bucket_capacity / 60.0  # tokens per second
+        self.bucket_lock = threading.Lock()
+        self.last_refill = time.monotonic()
+    
+    def wait_for_cooldown(self):
+        """Pause only if a 429 was seen within the last BATCH_DELAY seconds"""
+        delay = BATCH_DELAY - (time.time() - self.last_429_time)
+        if delay > 0:
+            logger.info(f"Recently rate limited. Waiting {delay:.1f}s before next request...")
+            time.sleep(delay)
+    
+    def acquire(self):
+        """Take a token from the bucket before a Sheets request, blocking until one is available"""
+        # Concurrent workers all back off together after any of them is rate limited
+        self.wait_for_cooldown()
+        
+        while True:
+            with self.bucket_lock:
+                now = time.monotonic()
+                self.bucket_tokens = min(
+                    self.bucket_capacity,
+                    self.bucket_tokens + (now - self.last_refill) * self.bucket_refill_rate
+                )
+                self.last_refill = now
+                
+                if self.bucket_tokens >= 1:
+                    self.bucket_tokens -= 1
+                    return
+                
+                wait = (1 - self.bucket_tokens) / self.bucket_refill_rate
+            
+            time.sleep(wait)
     
     def exponential_backoff_with_jitter(self, attempt: int) -> float:
-        """Calculate delay with exponential backoff and jitter"""
-        delay = min(self.base_delay * (2 ** attempt), self.max_delay)
-        jitter = delay * 0.25 * random.random()
-        return delay + jitter
+        """Calculate delay with exponential backoff and full jitter"""
+        cap = min(self.base_delay * (2 ** attempt), self.max_delay)
+        return random.random() * cap
+    
+    def _classify_error(self, e: Exception) -> Optional[str]:
+        """Classify an error as 'rate_limit', 'server', 'quota' or 'timeout', or None if not retryable"""
+        status_code = getattr(getattr(e, 'resp', None), 'status', None)
+        if status_code is not None:
+            if status_code == 429:  # Rate limit exceeded
+                return 'rate_limit'
+            if status_code >= 500:  # Server errors
+                return 'server'
+            return None
+        
+        message = str(e).lower()
+        if "quota" in message or "rate" in message:
+            return 'quota'
+        if "timeout" in message or "timed out" in message:
+            return 'timeout'
+        return None
+    
+    def _retry_delay(self, e: Exception, category: str, attempt: int) -> float:
+        """Calculate how long to wait before retrying an error of the given category"""
+        if category == 'rate_limit':
+            # httplib2.Response is a dict of lower-cased header names
+            retry_after = e.resp.get('retry-after') or e.resp.get('Retry-After')
+            try:
+                delay = float(retry_after)
+                logger.warning(f"Rate limited. Waiting {delay}s (from Retry-After header)")
+            except (TypeError, ValueError):
+                delay = self.exponential_backoff_with_jitter(attempt)
+                logger.warning(f"Rate limited. Waiting {delay:.2f}s (exponential backoff)")
+        elif category == 'server':
+            delay = self.exponential_backoff_with_jitter(attempt)
+            logger.warning(f"Server error {e.resp.status}. Retrying in {delay:.2f}s")
+        elif category == 'quota':
+            delay = self.exponential_backoff_with_jitter(attempt)
+            logger.warning(f"Quota/rate error. Retrying in {delay:.2f}s")
+        else:
+            delay = self.exponential_backoff_with_jitter(attempt)
+            logger.warning(f"Timeout error. Retrying in {delay:.2f}s (attempt {attempt + 1}/{self.max_retries})")
+        return delay
     
     def rate_limit_decorator(self, func):
         """Decorator for rate limiting API calls"""
         @wraps(func)
         def wrapper(*args, **kwargs):
-            last_exception = None
-            
             for attempt in range(self.max_retries):
                 try:
                     result = func(*args, **kwargs)
@@ -62,58 +247,58 @@ class RateLimiter:
                     return result
                     
                 except Exception as e:
-                    last_exception = e
+                    category = self._classify_error(e)
+                    if category == 'rate_limit':
+                        self.last_429_time = time.time()
                     
-                    # Check for rate limit errors
-                    if hasattr(e, 'resp') and hasattr(e.resp, 'status'):
-                        status_code = e.resp.status
-                        if status_code == 429:  # Rate limit exceeded
-                            retry_after = getattr(e.resp, 'retry-after', None)
-                            if retry_after:
-                                delay = float(retry_after)
-                                logger.warning(f"Rate limited. Waiting {delay}s (from Retry-After header)")
-                            else:
-                                delay = self.exponential_backoff_with_jitter(attempt)
-                                logger.warning(f"Rate limited. Waiting {delay:.2f}s (exponential backoff)")
-                        elif status_code >= 500:  # Server errors
-                            delay = self.exponential_backoff_with_jitter(attempt)
-                            logger.warning(f"Server error {status_code}. Retrying in {delay:.2f}s")
-                        else:
+                    if category is None:
+                        status_code = getattr(getattr(e, 'resp', None), 'status', None)
+                        if status_code is not None:
                             logger.error(f"Non-retryable error {status_code}: {sanitize_error_message(str(e))}")
-                            break
-                    elif "quota" in str(e).lower() or "rate" in str(e).lower():
-                        delay = self.exponential_backoff_with_jitter(attempt)
-                        logger.warning(f"Quota/rate error. Retrying in {delay:.2f}s")
-                    elif "timeout" in str(e).lower() or "timed out" in str(e).lower():
-                        delay = self.exponential_backoff_with_jitter(attempt)
-                        logger.warning(f"Timeout error. Retrying in {delay:.2f}s (attempt {attempt + 1}/{self.max_retries})")
-                    else:
-                        logger.error(f"Non-retryable error: {sanitize_error_message(str(e))}")
-                        break
-                    
-                    if attempt < self.max_retries - 1:
-                        time.sleep(delay)
-                    else:
+                        else:
+                            logger.error(f"Non-retryable error: {sanitize_error_message(str(e))}")
+                        raise
+                    if attempt + 1 >= self.max_retries:
                         logger.error(f"Max retries ({self.max_retries}) exceeded")
-            
-            raise last_exception
+                        raise
+                    
+                    time.sleep(self._retry_delay(e, category, attempt))
         return wrapper
 
+# Shared by every decorated call so backoff state is coordinated across methods and threads
+_rate_limiter = RateLimiter()
+
 class SheetsBackup:
     """Main backup class with robust error handling and rate limiting"""
     
     def __init__(self):
-        self.rate_limiter = RateLimiter()
-        self.sheets_service = None
+        self.rate_limiter = _rate_limiter
+        self.credentials = None
+        self._thread_local = threading.local()
         self.s3_client = None
         self.bucket_name = os.getenv('AWS_S3_BUCKET')
         self.webhook_url = os.getenv('GOOGLE_CHAT_WEBHOOK')
         self.backup_results = []
+        self._sheet_titles = {}
+        
+        # One timestamp per run so all workbooks land in the same dataset snapshot
+        # Use WAT timezone (UTC+1)
+        wat_tz = pytz.timezone('Africa/Lagos')
+        self.backup_timestamp = datetime.now(wat_tz).strftime('%Y%m%d_%I-%M%p_WAT')
         
         # Initialize services
         self._init_google_sheets()
         self._init_aws_s3()
     
+    @property
+    def sheets_service(self):
+        """Google Sheets API client for the current thread (the client is not thread-safe)"""
+        service = getattr(self._thread_local, 'sheets_service', None)
+        if service is None:
+            service = build('sheets', 'v4', credentials=self.credentials)
+            self._thread_local.sheets_service = service
+        return service
+    
     def _init_google_sheets(self):
         """Initialize Google Sheets API client"""
         try:
@@ -121,13 +306,14 @@ class SheetsBackup:
                 os.getenv('GOOGLE_SERVICE_ACCOUNT_JSON')
             ).decode('utf-8')
             
-            credentials_dict = json.loads(service_account_json)
-            credentials = service_account.Credentials.from_service_account_info(
+            credentials_dict = (orjson or json).loads(service_account_json)
+            self.credentials = service_account.Credentials.from_service_account_info(
                 credentials_dict,
                 scopes=['https://www.googleapis.com/auth/spreadsheets.readonly']
             )
             
-            self.sheets_service = build('sheets', 'v4', credentials=credentials)
+            # Build the client for the main thread up front so config errors surface early
+            self._thread_local.sheets_service = build('sheets', 'v4', credentials=self.credentials)
             logger.info("Google Sheets API initialized successfully")
             
         except Exception as e:
@@ -141,7 +327,9 @@ class SheetsBackup:
                 's3',
                 aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
                 aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
-                region_name=os.getenv('AWS_DEFAULT_REGION')
+                region_name=os.getenv('AWS_DEFAULT_REGION'),
+                # Shared across worker threads, each running a multipart upload
+                config=BotoConfig(max_pool_connections=MAX_WORKERS * S3_MAX_CONCURRENCY)
             )
             logger.info("AWS S3 client initialized successfully")
             
@@ -149,103 +337,112 @@ class SheetsBackup:
             logger.error(f"Failed to initialize AWS S3 client: {e}")
             raise
     
-    @RateLimiter().rate_limit_decorator
-    def _fetch_sheet_data(self, sheet_id: str, sheet_name: str) -> pd.DataFrame:
+    def _get_sheet_titles(self, sheet_id: str) -> Tuple[str, ...]:
+        """Get the tab titles of a spreadsheet, cached so retries skip the metadata call"""
+        if sheet_id not in self._sheet_titles:
+            self.rate_limiter.acquire()
+            sheet_metadata = self.sheets_service.spreadsheets().get(
+                spreadsheetId=sheet_id,
+                fields='sheets.properties.title'
+            ).execute()
+            self._sheet_titles[sheet_id] = tuple(
+                sheet['properties']['title'] for sheet in sheet_metadata.get('sheets', [])
+            )
+        return self._sheet_titles[sheet_id]
+    
+    @_rate_limiter.rate_limit_decorator
+    def _fetch_sheet_data(self, sheet_id: str, sheet_name: str) -> pa.Table:
         """Fetch data from a Google Sheet with rate limiting"""
         try:
             logger.info(f"Fetching data for sheet: {sheet_name}")
             
-            # Get sheet metadata to find all sheets
-            sheet_metadata = self.sheets_service.spreadsheets().get(
-                spreadsheetId=sheet_id
-            ).execute()
-            
             # Get data from all sheets in the spreadsheet
-            all_data = []
-            sheets = sheet_metadata.get('sheets', [])
+            all_tables = []
+            sheet_titles = self._get_sheet_titles(sheet_id)
+            if not sheet_titles:
+                logger.warning(f"No data found for sheet: {sheet_name}")
+                return pa.table({})
             
-            for sheet in sheets:
-                sheet_title = sheet['properties']['title']
-                range_name = f"'{sheet_title}'"
-                
-                result = self.sheets_service.spreadsheets().values().get(
-                    spreadsheetId=sheet_id,
-                    range=range_name,
-                    valueRenderOption='FORMATTED_VALUE'
-                ).execute()
-                
-                values = result.get('values', [])
+            # Fetch every tab in a single batchGet round-trip
+            ranges = [f"'{sheet_title}'" for sheet_title in sheet_titles]
+            self.rate_limiter.acquire()
+            result = self.sheets_service.spreadsheets().values().batchGet(
+                spreadsheetId=sheet_id,
+                ranges=ranges,
+                # Raw numbers keep numeric parquet types; dates stay as display strings
+                valueRenderOption='UNFORMATTED_VALUE',
+                dateTimeRenderOption='FORMATTED_STRING'
+            ).execute()
+            
+            for sheet_title, value_range in zip(sheet_titles, result.get('valueRanges', [])):
+                values = value_range.get('values', [])
                 if values:
                     # Handle Pullus sheets structure: skip summary rows (0-1), use row 2 as header
                     if len(values) > 3:  # Need at least 4 rows (summary + header + data)
                         # Row 2 is the actual data header
                         header = values[2]
-                        data_rows = []
-                        
                         # Rows 3+ are actual data
-                        for row in values[3:]:
-                            # Pad or truncate row to match header length
-                            if len(row) < len(header):
-                                row.extend([''] * (len(header) - len(row)))
-                            elif len(row) > len(header):
-                                row = row[:len(header)]
-                            data_rows.append(row)
+                        data_rows = values[3:]
                         
-                        if data_rows:  # Only create DataFrame if we have data
-                            df = pd.DataFrame(data_rows, columns=header)
-                            # Add sheet name as a column
-                            df['sheet_name'] = sheet_title
-                            all_data.append(df)
+                        if data_rows:  # Only create a table if we have data
+                            all_tables.append(rows_to_table(header, data_rows, sheet_title))
                     elif len(values) > 1:
                         # Fallback for sheets with different structure
                         header = values[0]
-                        data_rows = []
-                        
-                        for row in values[1:]:
-                            if len(row) < len(header):
-                                row.extend([''] * (len(header) - len(row)))
-                            elif len(row) > len(header):
-                                row = row[:len(header)]
-                            data_rows.append(row)
+                        data_rows = values[1:]
                         
                         if data_rows:
-                            df = pd.DataFrame(data_rows, columns=header)
-                            df['sheet_name'] = sheet_title
-                            all_data.append(df)
-                
-                # Add delay between sheet requests
-                time.sleep(2)
+                            all_tables.append(rows_to_table(header, data_rows, sheet_title))
             
-            if all_data:
-                combined_df = pd.concat(all_data, ignore_index=True)
-                logger.info(f"Successfully fetched {len(combined_df)} rows for {sheet_name}")
-                return combined_df
+            if all_tables:
+                combined_table = combine_tables(all_tables)
+                logger.info(f"Successfully fetched {combined_table.num_rows} rows for {sheet_name}")
+                return combined_table
             else:
                 logger.warning(f"No data found for sheet: {sheet_name}")
-                return pd.DataFrame()
+                return pa.table({})
                 
         except Exception as e:
             logger.error(f"Failed to fetch data for {sheet_name}: {sanitize_error_message(str(e))}")
             raise
     
-    @RateLimiter().rate_limit_decorator
-    def _upload_to_s3(self, data: pd.DataFrame, sheet_name: str) -> str:
+    @_rate_limiter.rate_limit_decorator
+    def _upload_to_s3(self, data: pa.Table, sheet_name: str) -> str:
         """Upload data to S3 in Parquet format with rate limiting"""
         try:
-            # Use WAT timezone (UTC+1)
-            wat_tz = pytz.timezone('Africa/Lagos')
-            timestamp = datetime.now(wat_tz).strftime('%Y%m%d_%I-%M%p_WAT')
-            s3_key = f"pullus/sales/{sheet_name}/{timestamp}.parquet"
+            # Hive-style layout lets query engines prune by workbook; the data already
+            # has a sheet_name column for the tab, so the partition key is "workbook".
+            # The value is percent-encoded, matching pyarrow's default Hive segment encoding
+            partition = quote(sheet_name, safe='')
+            s3_key = f"{S3_PREFIX}/{self.backup_timestamp}/workbook={partition}/part-0.parquet"
             
-            # Convert DataFrame to Parquet bytes
-            parquet_buffer = data.to_parquet(index=False, engine='pyarrow')
+            # Write Parquet in row groups into an Arrow buffer
+            sink = pa.BufferOutputStream()
+            with pq.ParquetWriter(
+                sink,
+                data.schema,
+                compression='zstd',
+                compression_level=3,
+                use_dictionary=True,
+                data_page_version='2.0'
+            ) as writer:
+                writer.write_table(data, row_group_size=PARQUET_ROW_GROUP_SIZE)
             
-            # Upload to S3
-            self.s3_client.put_object(
-                Bucket=self.bucket_name,
-                Key=s3_key,
-                Body=parquet_buffer,
-                ContentType='application/octet-stream'
+            # Read the buffer in place rather than copying it into Python bytes
+            parquet_buffer = pa.BufferReader(sink.getvalue())
+            
+            # Upload to S3, switching to parallel multipart upload for large files
+            self.s3_client.upload_fileobj(
+                parquet_buffer,
+                self.bucket_name,
+                s3_key,
+                Config=TransferConfig(
+                    multipart_threshold=S3_MULTIPART_CHUNKSIZE,
+                    multipart_chunksize=S3_MULTIPART_CHUNKSIZE,
+                    max_concurrency=S3_MAX_CONCURRENCY,
+                    use_threads=True
+                ),
+                ExtraArgs={'ContentType': 'application/octet-stream'}
             )
             
             s3_url = f"s3://{self.bucket_name}/{s3_key}"
@@ -272,7 +469,7 @@ class SheetsBackup:
             # Fetch sheet data
             data = self._fetch_sheet_data(sheet_id, sheet_name)
             
-            if data.empty:
+            if data.num_rows == 0:
                 result['error'] = "No data found in sheet"
                 logger.warning(f"No data found for sheet: {sheet_name}")
                 return result
@@ -283,11 +480,11 @@ class SheetsBackup:
             result.update({
                 'success': True,
                 's3_url': s3_url,
-                'rows_backed_up': len(data),
+                'rows_backed_up': data.num_rows,
                 'duration_seconds': round(time.time() - start_time, 2)
             })
             
-            logger.info(f"Successfully backed up {sheet_name}: {len(data)} rows in {result['duration_seconds']}s")
+            logger.info(f"Successfully backed up {sheet_name}: {data.num_rows} rows in {result['duration_seconds']}s")
             
         except Exception as e:
             result.update({
@@ -299,28 +496,37 @@ class SheetsBackup:
         return result
     
     def backup_all_sheets(self) -> List[Dict[str, Any]]:
-        """Backup all configured sheets with proper spacing"""
+        """Backup all configured sheets concurrently"""
         logger.info("Starting backup process for all sheets")
         start_time = time.time()
         
-        for i, (sheet_name, sheet_id) in enumerate(SHEETS_CONFIG.items()):
-            logger.info(f"Processing sheet {i+1}/{len(SHEETS_CONFIG)}: {sheet_name}")
-            
-            result = self.backup_single_sheet(sheet_name, sheet_id)
-            self.backup_results.append(result)
+        if not SHEETS_CONFIG:
+            logger.warning("No sheets configured for backup")
+            return self.backup_results
+        
+        results = {}
+        max_workers = min(MAX_WORKERS, len(SHEETS_CONFIG))
+        logger.info(f"Processing {len(SHEETS_CONFIG)} sheets with {max_workers} workers")
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.backup_single_sheet, sheet_name, sheet_id): sheet_name
+                for sheet_name, sheet_id in SHEETS_CONFIG.items()
+            }
             
-            # Add delay between sheets to respect rate limits
-            if i < len(SHEETS_CONFIG) - 1:  # Don't delay after the last sheet
-                delay = 5 + random.uniform(1, 3)  # 5-8 seconds with jitter
-                logger.info(f"Waiting {delay:.1f}s before next sheet...")
-                time.sleep(delay)
+            for future in as_completed(futures):
+                sheet_name = futures[future]
+                results[sheet_name] = future.result()
+                logger.info(f"Finished sheet {len(results)}/{len(SHEETS_CONFIG)}: {sheet_name}")
+        
+        # Keep results in configuration order for reporting
+        self.backup_results.extend(results[sheet_name] for sheet_name in SHEETS_CONFIG)
         
         total_duration = time.time() - start_time
         logger.info(f"Backup process completed in {total_duration:.2f} seconds")
         
         return self.backup_results
     
-    @RateLimiter().rate_limit_decorator
     def send_notification(self, results: List[Dict[str, Any]]):
         """Send notification to Google Chat with backup results"""
         try:
@@ -376,9 +582,9 @@ class SheetsBackup:
                 })
             
             # Send notification
-            response = requests.post(
+            response = _http.post(
                 self.webhook_url,
-                json=message,
+                data=orjson.dumps(message) if orjson else json.dumps(message).encode('utf-8'),
                 headers={'Content-Type': 'application/json'},
                 timeout=30
             )
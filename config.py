@@ -8,6 +8,11 @@ All sheets will be backed up to S3 in Parquet format.
 import json
 import os
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 def get_sheets_config():
     """Load sheets configuration from environment variable"""
     sheets_json = os.getenv('SHEETS_CONFIG_JSON')
@@ -15,8 +20,8 @@ def get_sheets_config():
         raise ValueError("SHEETS_CONFIG_JSON environment variable not found")
     
     try:
-        return json.loads(sheets_json)
-    except json.JSONDecodeError as e:
+        return (orjson or json).loads(sheets_json)
+    except json.JSONDecodeError as e:  # orjson.JSONDecodeError subclasses this
         raise ValueError(f"Invalid JSON in SHEETS_CONFIG_JSON: {e}")
 
 # Google Sheets configuration loaded from environment
@@ -24,11 +29,16 @@ SHEETS_CONFIG = get_sheets_config()
 
 # S3 configuration
 S3_PREFIX = 'pullus/sales'
+S3_MULTIPART_CHUNKSIZE = 8 * 1024 * 1024  # bytes; also the multipart threshold
+S3_MAX_CONCURRENCY = 10  # parallel part uploads per file
 
 # Backup settings
 BACKUP_FORMAT = 'parquet'
-RATE_LIMIT_DELAY = 2  # seconds between API calls
-BATCH_DELAY = 5  # seconds between sheet processing
+PARQUET_ROW_GROUP_SIZE = 50_000  # rows per Parquet row group
+TEXT_COLUMNS = frozenset()  # column names always stored as text (e.g. phone numbers, IDs)
+BATCH_DELAY = 5  # seconds to hold off Sheets requests after a 429
+MAX_WORKERS = 8  # maximum workbooks backed up concurrently
+SHEETS_REQUESTS_PER_MINUTE = 60  # Sheets API read quota per user
 
 # Timeout settings
 API_TIMEOUT = 120  # seconds for API calls
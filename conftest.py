@@ -0,0 +1,4 @@
+import os
+
+# config.py reads the sheets configuration at import time
+os.environ.setdefault('SHEETS_CONFIG_JSON', '{}')
@@ -0,0 +1,176 @@
+import httplib2
+import pytest
+from googleapiclient.errors import HttpError
+
+import backup_sheets
+from backup_sheets import RateLimiter
+
+
+def http_error(status, headers=None):
+    return HttpError(httplib2.Response({'status': status, **(headers or {})}), b'')
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    calls = []
+    monkeypatch.setattr(backup_sheets.time, 'sleep', calls.append)
+    return calls
+
+
+def failing_call(limiter, errors):
+    """Decorate a function that raises the given errors in turn, then succeeds"""
+    attempts = []
+
+    @limiter.rate_limit_decorator
+    def call():
+        attempts.append(1)
+        if len(attempts) <= len(errors):
+            raise errors[len(attempts) - 1]
+        return 'ok'
+
+    return call, attempts
+
+
+def test_client_error_raises_immediately(sleeps):
+    limiter = RateLimiter(max_retries=3)
+    call, attempts = failing_call(limiter, [http_error(403)])
+
+    with pytest.raises(HttpError):
+        call()
+    assert len(attempts) == 1
+    assert sleeps == []
+
+
+def test_server_error_retries_up_to_max_retries(sleeps):
+    limiter = RateLimiter(max_retries=3)
+    call, attempts = failing_call(limiter, [http_error(500)] * 3)
+
+    with pytest.raises(HttpError):
+        call()
+    assert len(attempts) == 3
+    assert len(sleeps) == 2
+
+
+def test_final_attempt_reraises_without_sleeping(sleeps):
+    limiter = RateLimiter(max_retries=1)
+    call, attempts = failing_call(limiter, [http_error(503)])
+
+    with pytest.raises(HttpError):
+        call()
+    assert len(attempts) == 1
+    assert sleeps == []
+
+
+def test_quota_error_without_status_is_retried(sleeps):
+    limiter = RateLimiter(max_retries=3)
+    call, attempts = failing_call(limiter, [RuntimeError("Quota exceeded for reads")])
+
+    assert call() == 'ok'
+    assert len(attempts) == 2
+    assert len(sleeps) == 1
+
+
+def test_unknown_error_without_status_raises_immediately(sleeps):
+    limiter = RateLimiter(max_retries=3)
+    call, attempts = failing_call(limiter, [ValueError("bad input")])
+
+    with pytest.raises(ValueError):
+        call()
+    assert len(attempts) == 1
+    assert sleeps == []
+
+
+def test_rate_limit_sleeps_for_retry_after_header(sleeps):
+    limiter = RateLimiter(max_retries=3)
+    call, attempts = failing_call(limiter, [http_error(429, {'Retry-After': '7'})])
+
+    assert call() == 'ok'
+    assert sleeps == [7.0]
+
+
+@pytest.mark.parametrize('retry_after', ['soon', 'Wed, 21 Oct 2015 07:28:00 GMT'])
+def test_rate_limit_with_unusable_retry_after_falls_back_to_backoff(sleeps, monkeypatch, retry_after):
+    monkeypatch.setattr(backup_sheets.random, 'random', lambda: 0.5)
+    limiter = RateLimiter(max_retries=3)
+    call, attempts = failing_call(limiter, [http_error(429, {'Retry-After': retry_after})])
+
+    assert call() == 'ok'
+    assert sleeps == [0.5 * limiter.base_delay]
+
+
+def test_rate_limit_records_last_429_time(sleeps, monkeypatch):
+    monkeypatch.setattr(backup_sheets.time, 'time', lambda: 1234.5)
+    limiter = RateLimiter(max_retries=3)
+    call, attempts = failing_call(limiter, [http_error(429)])
+
+    call()
+    assert limiter.last_429_time == 1234.5
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake monotonic clock that time.sleep advances"""
+    now = [1000.0]
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    monkeypatch.setattr(backup_sheets.time, 'monotonic', lambda: now[0])
+    monkeypatch.setattr(backup_sheets.time, 'sleep', sleep)
+    return now, sleeps
+
+
+def test_bucket_allows_a_full_quota_without_blocking(clock):
+    now, sleeps = clock
+    limiter = RateLimiter()
+
+    for _ in range(backup_sheets.SHEETS_REQUESTS_PER_MINUTE):
+        limiter.acquire()
+    assert sleeps == []
+
+
+def test_bucket_blocks_for_one_refill_interval_when_empty(clock):
+    now, sleeps = clock
+    limiter = RateLimiter()
+    for _ in range(limiter.bucket_capacity):
+        limiter.acquire()
+
+    limiter.acquire()
+    assert sleeps == [pytest.approx(1 / limiter.bucket_refill_rate)]
+
+
+def test_bucket_refills_up_to_capacity_only(clock):
+    now, sleeps = clock
+    limiter = RateLimiter()
+    for _ in range(limiter.bucket_capacity):
+        limiter.acquire()
+
+    now[0] += 10 * 60  # far longer than a full refill
+    for _ in range(limiter.bucket_capacity):
+        limiter.acquire()
+    assert sleeps == []
+
+    limiter.acquire()
+    assert len(sleeps) == 1
+
+
+def test_acquire_waits_out_cooldown_after_recent_429(clock, monkeypatch):
+    now, sleeps = clock
+    monkeypatch.setattr(backup_sheets.time, 'time', lambda: 2000.0)
+    limiter = RateLimiter()
+    limiter.last_429_time = 2000.0 - 2
+
+    limiter.acquire()
+    assert sleeps == [pytest.approx(backup_sheets.BATCH_DELAY - 2)]
+
+
+def test_acquire_does_not_wait_when_last_429_is_old(clock, monkeypatch):
+    now, sleeps = clock
+    monkeypatch.setattr(backup_sheets.time, 'time', lambda: 2000.0)
+    limiter = RateLimiter()
+    limiter.last_429_time = 2000.0 - backup_sheets.BATCH_DELAY - 1
+
+    limiter.acquire()
+    assert sleeps == []
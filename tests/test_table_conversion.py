@@ -0,0 +1,97 @@
+import json
+
+import pyarrow as pa
+
+from backup_sheets import column_to_array, column_to_text, combine_tables, rows_to_table
+
+
+def test_column_to_array_infers_numbers_with_blank_cells_as_nulls():
+    array = column_to_array([1, '', 3, None])
+    assert array.type == pa.int64()
+    assert array.to_pylist() == [1, None, 3, None]
+
+
+def test_column_to_array_keeps_all_blank_column_null_typed():
+    array = column_to_array(['', None])
+    assert pa.types.is_null(array.type)
+    assert len(array) == 2
+
+
+def test_column_to_array_falls_back_to_text_for_mixed_values():
+    array = column_to_array([1, 'n/a', 1.5, True, None])
+    assert array.type == pa.string()
+    assert array.to_pylist() == ['1', 'n/a', '1.5', 'true', '']
+
+
+def test_column_to_array_stores_integers_beyond_int64_as_text():
+    array = column_to_array(json.loads('[12345678901234567890, 1, ""]'))
+    assert array.type == pa.string()
+    assert array.to_pylist() == ['12345678901234567890', '1', '']
+
+
+def test_rows_to_table_handles_integers_beyond_int64():
+    table = rows_to_table(['id'], json.loads('[[12345678901234567890], [1]]'), 'Jan')
+    assert table.column('id').to_pylist() == ['12345678901234567890', '1']
+
+
+def test_column_to_array_respects_text_flag():
+    array = column_to_array([803, ''], is_text=True)
+    assert array.to_pylist() == ['803', '']
+
+
+def test_column_to_text_matches_arrow_cast():
+    values = [1.0, 1500.0, 1e16, True]
+    expected = [pa.array([value]).cast(pa.string())[0].as_py() for value in values]
+    assert column_to_text(values).to_pylist() == expected
+
+
+def test_rows_to_table_pads_and_truncates_ragged_rows():
+    table = rows_to_table(['a', 'b'], [[1, 'x', 'extra'], [2]], 'Jan')
+    assert table.column_names == ['a', 'b', 'sheet_name']
+    assert table.to_pydict() == {
+        'a': [1, 2],
+        'b': ['x', ''],
+        'sheet_name': ['Jan', 'Jan'],
+    }
+
+
+def test_rows_to_table_stringifies_header_names():
+    table = rows_to_table([2024, 'qty'], [[1, 2]], 'Jan')
+    assert table.column_names == ['2024', 'qty', 'sheet_name']
+
+
+def test_rows_to_table_replaces_existing_sheet_name_column():
+    table = rows_to_table(['sheet_name', 'qty'], [['old', 1]], 'Jan')
+    assert table.column_names == ['qty', 'sheet_name']
+    assert table.column('sheet_name').to_pylist() == ['Jan']
+
+
+def test_combine_tables_with_existing_sheet_name_column():
+    jan = rows_to_table(['sheet_name', 'qty'], [['old', 1]], 'Jan')
+    feb = rows_to_table(['sheet_name', 'qty'], [['old', 2]], 'Feb')
+    combined = combine_tables([jan, feb])
+    assert combined.column('sheet_name').to_pylist() == ['Jan', 'Feb']
+
+
+def test_combine_tables_fills_blank_tab_with_nulls():
+    jan = rows_to_table(['qty'], [[1], [2]], 'Jan')
+    feb = rows_to_table(['qty'], [[''], []], 'Feb')
+    combined = combine_tables([jan, feb])
+    assert combined.schema.field('qty').type == pa.int64()
+    assert combined.column('qty').to_pylist() == [1, 2, None, None]
+
+
+def test_combine_tables_fills_missing_columns_with_nulls():
+    jan = rows_to_table(['a', 'b'], [[1, 'x']], 'Jan')
+    feb = rows_to_table(['a', 'c'], [[2, 'y']], 'Feb')
+    combined = combine_tables([jan, feb])
+    assert combined.column('b').to_pylist() == ['x', None]
+    assert combined.column('c').to_pylist() == [None, 'y']
+
+
+def test_combine_tables_stores_conflicting_column_as_text_consistently():
+    jan = rows_to_table(['code'], [[1.0], [2.5]], 'Jan')
+    feb = rows_to_table(['code'], [[True], ['n/a']], 'Feb')
+    combined = combine_tables([jan, feb])
+    assert combined.schema.field('code').type == pa.string()
+    assert combined.column('code').to_pylist() == ['1', '2.5', 'true', 'n/a']